@@ -2,8 +2,6 @@
 """Python classes for representing the generic part of BioMedical sheets
 """
 
-from collections import OrderedDict
-
 from .naming import DEFAULT_NAME_GENERATOR
 
 __author__ = 'Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>'
@@ -46,31 +44,32 @@ class CrawlMixin:
     Also provides helpers for merging "sub_entries" dicts
     """
 
+    __slots__ = ()
+
     def crawl(self, name, sep='-'):
         """Crawl through sheet based on the path by secondary id
         """
-        if sep in name:
-            next, rest = name.split(sep, 1)
-        else:
-            next, rest = name, None
-        if next not in self.sub_entries:
-            raise SecondaryIDNotFoundException(
-                'Could not find sub entry with secondary ID {}'.format(
-                    next))
-        if rest:
-            return self.sub_entries[next].crawl(rest)
-        else:
-            return self.sub_entries[next]
+        entry = self
+        for secondary_id in name.split(sep):
+            sub_entries = getattr(entry, 'sub_entries', None)
+            if sub_entries is None or secondary_id not in sub_entries:
+                raise SecondaryIDNotFoundException(
+                    'Could not find sub entry with secondary ID {}'.format(
+                        secondary_id))
+            entry = sub_entries[secondary_id]
+        return entry
 
     def _merge_sub_entries(self, *dicts):
         # Check for conflicts in secondary ids
+        seen = set()
         duplicates = set()
-        for d1 in dicts:
-            for d2 in dicts:
-                if d1 is not d2:
-                    dupes = set(d1.keys()) & set(d2.keys())
-                    duplicates = duplicates | dupes
-        if len(duplicates) > 0:
+        for d in dicts:
+            for key in d:
+                if key in seen:
+                    duplicates.add(key)
+                else:
+                    seen.add(key)
+        if duplicates:
             raise AmbiguousSecondaryIdException(
                 'Ambiguous secondary IDs: {}'.format(duplicates))
         # Build result
@@ -85,7 +84,7 @@ class Sheet(CrawlMixin):
     """
 
     def __init__(self, identifier, title, json_data, description=None,
-                 bio_entities=None, extra_infos=None, dict_type=OrderedDict,
+                 bio_entities=None, extra_infos=None, dict_type=dict,
                  name_generator=DEFAULT_NAME_GENERATOR):
         #: Identifier URI of the sheet, cannot be changed after construction
         self.identifier = identifier
@@ -96,21 +95,21 @@ class Sheet(CrawlMixin):
         #: Description of the sheet
         self.description = description
         #: Extra info, ``dict``-like object
-        self.extra_infos = dict_type(extra_infos or [])
+        self.extra_infos = dict_type(extra_infos) if extra_infos else dict_type()
         #: List of ``BioEntity`` objects described in the sheet
-        self.bio_entities = dict_type(bio_entities or [])
+        self.bio_entities = dict_type(bio_entities) if bio_entities else dict_type()
         #: Create ``sub_entries`` shortcut for ``crawl()``
         self.sub_entries = self.bio_entities
         #: Name generator used in the sheet
         self.name_generator = name_generator
 
     def __repr__(self):
-        return 'Sheet({})'.format(', '.join(map(str, [
-            self.identifier, self.title, self.json_data, self.description,
-            self.bio_entities, self.extra_infos, self.sub_entries])))
+        return 'Sheet({}, {}, {}, {})'.format(
+            self.identifier, self.title, self.description,
+            list(self.bio_entities))
 
     def __str__(self):
-        return repr(self)
+        return 'Sheet({}, {})'.format(self.identifier, self.title)
 
 
 class SheetEntry:
@@ -120,8 +119,11 @@ class SheetEntry:
     properties dict
     """
 
+    __slots__ = ('pk', 'disabled', 'secondary_id', 'extra_ids', 'extra_infos',
+                 'name_generator')
+
     def __init__(self, pk, disabled, secondary_id, extra_ids=None,
-                 extra_infos=None, dict_type=OrderedDict,
+                 extra_infos=None, dict_type=dict,
                  name_generator=DEFAULT_NAME_GENERATOR):
         #: Primary key of the bio entity, globally unique
         self.pk = pk
@@ -131,9 +133,9 @@ class SheetEntry:
         #: sheet
         self.secondary_id = secondary_id
         #: Extra IDs
-        self.extra_ids = list(extra_ids or [])
+        self.extra_ids = list(extra_ids) if extra_ids else []
         #: Extra info, ``dict``-like object
-        self.extra_infos = dict_type(extra_infos or [])
+        self.extra_infos = dict_type(extra_infos) if extra_infos else dict_type()
         #: Name generator to use
         self.name_generator = name_generator
 
@@ -157,14 +159,16 @@ class BioEntity(SheetEntry, CrawlMixin):
     """Represent one biological specimen
     """
 
+    __slots__ = ('bio_samples', 'sub_entries')
+
     def __init__(self, pk, disabled, secondary_id, extra_ids=None,
-                 extra_infos=None, bio_samples=None, dict_type=OrderedDict,
+                 extra_infos=None, bio_samples=None, dict_type=dict,
                  name_generator=DEFAULT_NAME_GENERATOR):
         super().__init__(
             pk, disabled, secondary_id, extra_ids, extra_infos, dict_type,
             name_generator)
         #: List of ``BioSample`` objects described for the ``BioEntity``
-        self.bio_samples = dict_type(bio_samples or [])
+        self.bio_samples = dict_type(bio_samples) if bio_samples else dict_type()
         # Assign owner pointer in bio samples to self
         for bio_sample in self.bio_samples.values():
             bio_sample.bio_entity = self
@@ -176,20 +180,22 @@ class BioEntity(SheetEntry, CrawlMixin):
         return self.secondary_id
 
     def __repr__(self):
-        return 'BioEntity({})'.format(', '.join(map(str, [
+        return 'BioEntity({}, {}, {}, {}, {}, {})'.format(
             self.pk, self.disabled, self.secondary_id, self.extra_ids,
-            self.extra_infos, self.bio_samples])))
+            self.extra_infos, list(self.bio_samples))
 
     def __str__(self):
-        return repr(self)
+        return 'BioEntity({}, {})'.format(self.pk, self.secondary_id)
 
 
 class BioSample(SheetEntry, CrawlMixin):
     """Represent one sample taken from a biological entity/specimen
     """
 
+    __slots__ = ('bio_entity', 'test_samples', 'sub_entries')
+
     def __init__(self, pk, disabled, secondary_id, extra_ids=None,
-                 extra_infos=None, test_samples=None, dict_type=OrderedDict,
+                 extra_infos=None, test_samples=None, dict_type=dict,
                  bio_entity=None, name_generator=DEFAULT_NAME_GENERATOR):
         super().__init__(
             pk, disabled, secondary_id, extra_ids, extra_infos, dict_type,
@@ -197,7 +203,7 @@ class BioSample(SheetEntry, CrawlMixin):
         #: Containing BioEntity
         self.bio_entity = bio_entity
         #: List of ``TestSample`` objects described for the ``BioSample``
-        self.test_samples = dict_type(test_samples or [])
+        self.test_samples = dict_type(test_samples) if test_samples else dict_type()
         # Assign owner pointer in test samples to self
         for test_sample in self.test_samples.values():
             test_sample.bio_sample = self
@@ -209,20 +215,22 @@ class BioSample(SheetEntry, CrawlMixin):
         return '-'.join((self.bio_entity.full_secondary_id, self.secondary_id))
 
     def __repr__(self):
-        return 'BioSample({})'.format(', '.join(map(str, [
+        return 'BioSample({}, {}, {}, {}, {}, {})'.format(
             self.pk, self.disabled, self.secondary_id, self.extra_ids,
-            self.extra_infos, self.test_samples])))
+            self.extra_infos, list(self.test_samples))
 
     def __str__(self):
-        return repr(self)
+        return 'BioSample({}, {})'.format(self.pk, self.secondary_id)
 
 
 class TestSample(SheetEntry, CrawlMixin):
     """Represent a technical sample from biological sample, e.g., DNA or RNA
     """
 
+    __slots__ = ('bio_sample', 'ngs_libraries', 'sub_entries')
+
     def __init__(self, pk, disabled, secondary_id, extra_ids=None,
-                 extra_infos=None, ngs_libraries=None, dict_type=OrderedDict,
+                 extra_infos=None, ngs_libraries=None, dict_type=dict,
                  bio_sample=None,
                  name_generator=DEFAULT_NAME_GENERATOR):
         super().__init__(
@@ -231,32 +239,35 @@ class TestSample(SheetEntry, CrawlMixin):
         #: Containing BioSample
         self.bio_sample = bio_sample
         #: List of ``NGSLibrary`` objects described for the ``TestSample``
-        self.ngs_libraries = dict_type(ngs_libraries or [])
+        self.ngs_libraries = dict_type(ngs_libraries) if ngs_libraries else dict_type()
         # Assign owner pointer in NGS libraries to self
         for ngs_library in self.ngs_libraries.values():
             ngs_library.test_sample = self
-        # ``sub_entries`` shortcut, check for duplicates
-        self.sub_entries = self._merge_sub_entries(self.ngs_libraries)
+        #: Create ``sub_entries`` shortcut for ``crawl()``, NGS libraries are
+        #: the only child type so there is nothing to merge or check
+        self.sub_entries = self.ngs_libraries
 
     @property
     def full_secondary_id(self):
         return '-'.join((self.bio_sample.full_secondary_id, self.secondary_id))
 
     def __repr__(self):
-        return 'TestSample({})'.format(', '.join(map(str, [
+        return 'TestSample({}, {}, {}, {}, {}, {})'.format(
             self.pk, self.disabled, self.secondary_id, self.extra_ids,
-            self.extra_infos, self.ngs_libraries])))
+            self.extra_infos, list(self.ngs_libraries))
 
     def __str__(self):
-        return repr(self)
+        return 'TestSample({}, {})'.format(self.pk, self.secondary_id)
 
 
 class NGSLibrary(SheetEntry):
     """Represent one NGSLibrary generated from a test sample
     """
 
+    __slots__ = ('test_sample',)
+
     def __init__(self, pk, disabled, secondary_id, extra_ids=None,
-                 extra_infos=None, dict_type=OrderedDict, test_sample=None,
+                 extra_infos=None, dict_type=dict, test_sample=None,
                  name_generator=DEFAULT_NAME_GENERATOR):
         super().__init__(
             pk, disabled, secondary_id, extra_ids, extra_infos, dict_type,
@@ -270,9 +281,9 @@ class NGSLibrary(SheetEntry):
             self.test_sample.full_secondary_id, self.secondary_id))
 
     def __repr__(self):
-        return 'NGSLibrary({})'.format(', '.join(map(str, [
+        return 'NGSLibrary({}, {}, {}, {}, {})'.format(
             self.pk, self.disabled, self.secondary_id, self.extra_ids,
-            self.extra_infos])))
+            self.extra_infos)
 
     def __str__(self):
-        return repr(self)
+        return 'NGSLibrary({}, {})'.format(self.pk, self.secondary_id)
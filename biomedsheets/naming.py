@@ -2,6 +2,7 @@
 """Helper code for name generation"""
 
 import re
+from string import Formatter
 
 
 #: PK padding length
@@ -55,6 +56,11 @@ class PatternNameGenerator(NameGenerator):
             raise ValueError(  # pragma: no cover
                 'Cannot map back from pattern {}'.format(pattern))
         self.inverse_name_re = INVERSE_PATTERN_MAP[self.pattern]
+        # Bound formatting function and whether the pattern uses the PK at
+        # all, so the padded PK is only built if needed
+        self._format = pattern.format
+        self._uses_pk = any(
+            field == 'pk' for _, field, _, _ in Formatter().parse(pattern))
 
     def inverse(self, name, component='secondary_id'):
         """Map from name to secondary_id/pk (given in ``component``)"""
@@ -66,9 +72,12 @@ class PatternNameGenerator(NameGenerator):
 
     def __call__(self, obj):
         """Return generated name"""
-        padded_pk = str(obj.pk).rjust(self.pk_padding_length, '0')
-        return self.pattern.format(
-            full_secondary_id=obj.full_secondary_id, pk=padded_pk)
+        if self._uses_pk:
+            padded_pk = str(obj.pk).rjust(self.pk_padding_length, '0')
+            return self._format(
+                full_secondary_id=obj.full_secondary_id, pk=padded_pk)
+        else:
+            return self._format(full_secondary_id=obj.full_secondary_id)
 
 
 #: Default name generator is a :py:class:`PatternNameGenerator` with
@@ -27,6 +27,8 @@ Also note that none of the shortcut objects will reflect changes in the
 underlying schema data structure.
 """
 
+from operator import attrgetter
+
 from .. import models
 
 __author__ = 'Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>'
@@ -94,38 +96,38 @@ class ShortcutSampleSheet:
 
 
 class ShortcutMixin:
-    """Mixin with helper functions"""
-
-    @property
-    def pk(self):
-        """Shortcut to ``pk`` property of wrapped object
+    """Mixin with helper functions
 
-        The value is usually generated by data management system/database.
-        """
-        return self.wrapped.pk
+    The shortcut values of the wrapped object are copied on construction,
+    consistent with shortcut objects not reflecting changes in the underlying
+    data structure.
+    """
 
-    @property
-    def secondary_id(self):
-        """Shortcut to ``secondary_id`` property of wrapped object
+    __slots__ = ('wrapped', 'pk', 'secondary_id', 'disabled', 'enabled',
+                 '_name')
 
-        The value is usually assigned by the data generator/customer
-        """
-        return self.wrapped.secondary_id
+    def __init__(self, wrapped):
+        #: Wrapped object
+        self.wrapped = wrapped
+        #: Shortcut to ``pk`` property of wrapped object, usually generated
+        #: by data management system/database
+        self.pk = wrapped.pk
+        #: Shortcut to ``secondary_id`` property of wrapped object, usually
+        #: assigned by the data generator/customer
+        self.secondary_id = wrapped.secondary_id
+        #: Whether the entry has been disabled
+        self.disabled = bool(wrapped.disabled)
+        #: Whether the entry has been enabled
+        self.enabled = not self.disabled
 
     @property
     def name(self):
-        """Return name generated for wrapped object"""
-        return self.wrapped.name
-
-    @property
-    def disabled(self):
-        """Return whether the entry has been disabled"""
-        return bool(self.wrapped.disabled)
-
-    @property
-    def enabled(self):
-        """Return whether the entry has been enabled"""
-        return not self.disabled
+        """Return name generated for wrapped object, cached on first access"""
+        try:
+            return self._name
+        except AttributeError:
+            self._name = self.wrapped.name
+            return self._name
 
     @property
     def extra_infos(self):
@@ -146,15 +148,18 @@ class BioSampleShortcut(ShortcutMixin):
     child type (e.g., NGS library) where the primary active will be picked.
     """
 
+    __slots__ = ('bio_entity', 'bio_sample', 'selector', 'test_sample',
+                 'assay_sample')
+
     def __init__(self, bio_entity, bio_sample, selector):
+        super().__init__(bio_sample)
         #: Containing shortcut to ``BioEntity``
         self.bio_entity = bio_entity
         #: Raw ``BioEntity``
         self.bio_sample = bio_sample
-        #: Wrapped for Shortcut Mixin
-        self.wrapped = bio_sample
-        # Check selector for being valid
-        if selector not in models.TEST_SAMPLE_CHILDREN:
+        # Check selector for being valid, NGS library selector fast path
+        if (selector is not models.KEY_NGS_LIBRARY and
+                selector not in models.TEST_SAMPLE_CHILDREN):
             raise InvalidSelector(
                 'Invalid test sample selector {}'.format(selector))
         #: Selector for ``TestSample`` children
@@ -166,12 +171,9 @@ class BioSampleShortcut(ShortcutMixin):
 
     def _get_test_sample(self):
         """Return appropriate ``TestSampleShortcut`` raise an exception"""
-        values = {
-            models.KEY_NGS_LIBRARY: lambda x: x.ngs_libraries.values(),
-        }
+        get_children = _TEST_SAMPLE_CHILDREN_GETTERS[self.selector]
         for test_sample in self.bio_sample.test_samples.values():
-            attr_lst = values.get(self.selector, lambda x: [])(test_sample)
-            for entity in attr_lst:
+            for entity in get_children(test_sample).values():
                 if not entity.disabled:
                     return TestSampleShortcut(self, test_sample, self.selector)
         raise MissingDataEntity(
@@ -179,12 +181,12 @@ class BioSampleShortcut(ShortcutMixin):
                 self.selector, self.bio_sample))
 
     def __repr__(self):
-        return 'BioSampleShortcut({})'.format(', '.join(map(str, [
-            self.bio_sample, self.selector, self.test_sample,
-            self.assay_sample])))
+        return 'BioSampleShortcut({}, {}, {}, {})'.format(
+            self.bio_sample, self.selector, self.test_sample.name,
+            self.assay_sample.name)
 
     def __str__(self):
-        return repr(self)
+        return 'BioSampleShortcut({})'.format(self.name)
 
 
 class TestSampleShortcut:
@@ -196,13 +198,27 @@ class TestSampleShortcut:
     child type (e.g., NGS library) where the primary active one will be picked.
     """
 
+    __slots__ = ('bio_sample', 'test_sample', 'selector', 'assay_sample',
+                 'pk', 'secondary_id', 'disabled', 'enabled', '_name')
+
     def __init__(self, bio_sample, test_sample, selector):
         #: Containing shortcut to ``BioSample``
         self.bio_sample = bio_sample
         #: Raw ``TestSample``
         self.test_sample = test_sample
-        # Check selector for being valid
-        if selector not in models.TEST_SAMPLE_CHILDREN:
+        #: Shortcut to ``pk`` property of wrapped ``TestSample``, usually
+        #: generated by data management system/database
+        self.pk = test_sample.pk
+        #: Shortcut to ``secondary_id`` property of wrapped ``TestSample``,
+        #: usually assigned by the data generator/customer
+        self.secondary_id = test_sample.secondary_id
+        #: Shortcut to ``disabled`` property of wrapped ``TestSample``
+        self.disabled = test_sample.disabled
+        #: Shortcut to ``enabled`` property of wrapped ``TestSample``
+        self.enabled = test_sample.enabled
+        # Check selector for being valid, NGS library selector fast path
+        if (selector is not models.KEY_NGS_LIBRARY and
+                selector not in models.TEST_SAMPLE_CHILDREN):
             raise InvalidSelector(
                 'Invalid test sample selector {}'.format(selector))
         #: Selector for ``TestSample`` children
@@ -210,101 +226,66 @@ class TestSampleShortcut:
         #: The selected ``TestSample`` child
         self.assay_sample = self._get_assay_sample()
 
-    @property
-    def pk(self):
-        """Shortcut to ``pk`` property of wrapped ``TestSample``
-
-        The value is usually generated by data management system/database.
-        """
-        return self.test_sample.pk
-
-    @property
-    def secondary_id(self):
-        """Shortcut to ``secondary_id`` property of wrapped ``TestSample``
-
-        The value is usually assigned by the data generator/customer
-        """
-        return self.test_sample.secondary_id
-
     @property
     def name(self):
-        """Return name generated for wrapped test sample"""
-        return self.test_sample.name
-
-    @property
-    def disabled(self):
-        """Shortcut to ``disabled`` property of wrapped ``TestSample``"""
-        return self.test_sample.disabled
-
-    @property
-    def enabled(self):
-        """Shortcut to ``enabled`` property of wrapped ``TestSample``"""
-        return self.test_sample.enabled
+        """Return name generated for wrapped test sample, cached on first
+        access
+        """
+        try:
+            return self._name
+        except AttributeError:
+            self._name = self.test_sample.name
+            return self._name
 
     def _get_assay_sample(self):
         """Return ``TestSample`` child or raise an exception"""
-        values = {
-            models.KEY_NGS_LIBRARY: lambda x: x.ngs_libraries.values(),
-        }
-        constructors = {
-            models.KEY_NGS_LIBRARY: NGSLibraryShortcut,
-        }
-        attr_lst = values.get(self.selector, lambda x: [])(self.test_sample)
-        for entity in attr_lst:
+        get_children = _TEST_SAMPLE_CHILDREN_GETTERS[self.selector]
+        for entity in get_children(self.test_sample).values():
             if not entity.disabled:
-                return constructors[self.selector](self, entity)
+                return _TEST_SAMPLE_CHILD_SHORTCUTS[self.selector](self, entity)
         raise MissingDataEntity(
             'Could not find data entity for type {} in {}'.format(
                 self.selector, self.test_sample))
 
     def __repr__(self):
-        return 'TestSampleShortcut({})'.format(', '.join(map(str, [
-            self.test_sample, self.selector, self.assay_sample])))
+        return 'TestSampleShortcut({}, {}, {})'.format(
+            self.test_sample, self.selector, self.assay_sample.name)
 
     def __str__(self):
-        return repr(self)
+        return 'TestSampleShortcut({})'.format(self.name)
 
 
 class TestSampleChildShortcut:
     """Helper base class for children of ``TestSampleShortcut``
     """
 
+    __slots__ = ('test_sample', 'wrapped', 'pk', 'secondary_id', 'disabled',
+                 'enabled', '_name')
+
     def __init__(self, test_sample, wrapped):
         #: Containing ``TestSampleChildShortcut``
         self.test_sample = test_sample
         #: Wrapped raw TestSample child
         self.wrapped = wrapped
-
-    @property
-    def pk(self):
-        """Shortcut to ``pk`` property of wrapped ``TestSample``
-
-        The value is usually generated by data management system/database.
-        """
-        return self.wrapped.pk
-
-    @property
-    def secondary_id(self):
-        """Shortcut to ``secondary_id`` property of wrapped ``TestSample``
-
-        The value is usually assigned by the data generator/customer
-        """
-        return self.wrapped.secondary_id
+        #: Shortcut to ``pk`` property of wrapped ``TestSample`` child,
+        #: usually generated by data management system/database
+        self.pk = wrapped.pk
+        #: Shortcut to ``secondary_id`` property of wrapped ``TestSample``
+        #: child, usually assigned by the data generator/customer
+        self.secondary_id = wrapped.secondary_id
+        #: Shortcut to ``disabled`` property of wrapped ``TestSample`` child
+        self.disabled = wrapped.disabled
+        #: Shortcut to ``enabled`` property of wrapped ``TestSample`` child
+        self.enabled = wrapped.enabled
 
     @property
     def name(self):
-        """Return name generated for wrapped object"""
-        return self.wrapped.name
-
-    @property
-    def disabled(self):
-        """Shortcut to ``disabled`` property of wrapped ``TestSample``"""
-        return self.wrapped.disabled
-
-    @property
-    def enabled(self):
-        """Shortcut to ``enabled`` property of wrapped ``TestSample``"""
-        return self.wrapped.enabled
+        """Return name generated for wrapped object, cached on first access"""
+        try:
+            return self._name
+        except AttributeError:
+            self._name = self.wrapped.name
+            return self._name
 
     @property
     def extra_infos(self):
@@ -316,7 +297,20 @@ class NGSLibraryShortcut(TestSampleChildShortcut):
     """Shortcut to NGSLibrary
     """
 
+    __slots__ = ('ngs_library',)
+
     def __init__(self, test_sample, ngs_library):
         super().__init__(test_sample, ngs_library)
         #: Wrapped raw ``NGSLibrary``
         self.ngs_library = ngs_library
+
+
+# Getters for the ``TestSample`` children dicts, by selector
+_TEST_SAMPLE_CHILDREN_GETTERS = {
+    models.KEY_NGS_LIBRARY: attrgetter('ngs_libraries'),
+}
+
+# Shortcut classes for the ``TestSample`` children, by selector
+_TEST_SAMPLE_CHILD_SHORTCUTS = {
+    models.KEY_NGS_LIBRARY: NGSLibraryShortcut,
+}
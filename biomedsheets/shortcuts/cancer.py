@@ -20,6 +20,9 @@ KEY_IS_TUMOR = 'isTumor'
 #: Key value for "extraction type" value
 KEY_EXTRACTION_TYPE = 'extractionType'
 
+# Sentinel for missing values in ``extra_infos`` lookups
+_MISSING = object()
+
 
 class CancerCaseSheetOptions:
     """Options for parsing cancer case sheets"""
@@ -61,43 +64,44 @@ class CancerCaseSheet(ShortcutSampleSheet):
         #: List of donors in the sample sheet
         self.donors = list(self._iter_donors())
         #: List of primary matched tumor/normal sample pairs in the sheet
-        self.primary_sample_pairs = list(self._iter_sample_pairs(True))
+        self.primary_sample_pairs = []
         #: List of all matched tumor/normal sample pairs in the sample sheet
-        self.all_sample_pairs = list(self._iter_sample_pairs(False))
+        self.all_sample_pairs = []
         #: Mapping of all sample pairs by name of primary DNA test sample
-        self.all_sample_pairs_by_tumor_dna_test_sample = OrderedDict(
-            (pair.tumor_sample.dna_test_sample.name, pair)
-            for pair in self.all_sample_pairs
-            if pair.tumor_sample and pair.tumor_sample.dna_test_sample)
+        self.all_sample_pairs_by_tumor_dna_test_sample = OrderedDict()
         #: Mapping of all sample pairs by name of primary DNA library name
-        self.all_sample_pairs_by_tumor_dna_ngs_library = OrderedDict(
-            (pair.tumor_sample.dna_ngs_library.name, pair)
-            for pair in self.all_sample_pairs
-            if pair.tumor_sample.dna_ngs_library)
+        self.all_sample_pairs_by_tumor_dna_ngs_library = OrderedDict()
         #: Mapping of all sample pairs by name of primary RNA library name
-        self.all_sample_pairs_by_tumor_rna_ngs_library = OrderedDict(
-            (pair.tumor_sample.rna_ngs_library.name, pair)
-            for pair in self.all_sample_pairs
-            if pair.tumor_sample.rna_ngs_library)
+        self.all_sample_pairs_by_tumor_rna_ngs_library = OrderedDict()
+        # Build the sample pair shortcuts
+        self._build_sample_pairs()
 
     def _iter_donors(self):
         """Return iterator over the donors in the study"""
         for bio_entity in self.sheet.bio_entities.values():
             yield CancerDonor(self, bio_entity)
 
-    def _iter_sample_pairs(self, only_primary_sample_pairs):
-        """Return iterator over the matched tumor/normal pairs
+    def _build_sample_pairs(self):
+        """Build the matched tumor/normal pair lists and mappings
 
-        If ``only_primary_sample`` is ``True`` then only one pair per donor
-        will be returned with the cancer sample marked as primary.  If this
-        flag is ``False`` then one pair for each ``cancer`` sample will be
-        returned.
+        For the primary pairs, one pair per donor is used with the cancer
+        sample marked as primary.  For all pairs, one pair for each cancer
+        sample is used.  All are collected in one pass over the donors.
         """
+        by_dna_test_sample = self.all_sample_pairs_by_tumor_dna_test_sample
+        by_dna_ngs_library = self.all_sample_pairs_by_tumor_dna_ngs_library
+        by_rna_ngs_library = self.all_sample_pairs_by_tumor_rna_ngs_library
         for donor in self.donors:
-            if only_primary_sample_pairs:
-                yield donor.primary_pair
-            else:
-                yield from donor.all_pairs
+            self.primary_sample_pairs.append(donor.primary_pair)
+            self.all_sample_pairs += donor.all_pairs
+            for pair in donor.all_pairs:
+                tumor_sample = pair.tumor_sample
+                if tumor_sample and tumor_sample.dna_test_sample:
+                    by_dna_test_sample[tumor_sample.dna_test_sample.name] = pair
+                if tumor_sample.dna_ngs_library:
+                    by_dna_ngs_library[tumor_sample.dna_ngs_library.name] = pair
+                if tumor_sample.rna_ngs_library:
+                    by_rna_ngs_library[tumor_sample.rna_ngs_library.name] = pair
 
 
 class CancerMatchedSamplePair:
@@ -114,8 +118,8 @@ class CancerMatchedSamplePair:
         self.normal_sample = normal_sample
 
     def __repr__(self):
-        return 'CancerMatchedSamplePair({})'.format(', '.join(
-            map(str, [self.donor, self.tumor_sample, self.normal_sample])))
+        return 'CancerMatchedSamplePair({}, {}, {})'.format(
+            self.donor.name, self.tumor_sample.name, self.normal_sample.name)
 
     def __str__(self):
         return repr(self)
@@ -129,18 +133,46 @@ class CancerBioSample(GenericBioSample):
     required.  This will change in the future
     """
 
+    __slots__ = ('donor', '_primary_dna_test_sample', '_primary_rna_test_sample',
+                 'dna_test_sample', 'dna_ngs_library', '_rna_test_sample',
+                 '_rna_ngs_library')
+
     def __init__(self, shortcut_bio_entity, bio_sample):
         super().__init__(shortcut_bio_entity, bio_sample)
         #: The ``CancerDonor`` from the sample sheet
         self.donor = shortcut_bio_entity
+        # Primary raw DNA and RNA ``TestSample`` objects, classified in one
+        # pass over the wrapped bio sample's test samples
+        self._primary_dna_test_sample, self._primary_rna_test_sample = (
+            self._classify_test_samples())
         #: The primary DNA test sample
         self.dna_test_sample = self._get_primary_dna_test_sample()
-        #: The primary RNA test sample, if any
-        self.rna_test_sample = self._get_primary_rna_test_sample()
         #: The primary DNA NGS library for this sample
         self.dna_ngs_library = self._get_primary_dna_ngs_library()
-        #: The primary RNA NGS library for this sample, if any
-        self.rna_ngs_library = self._get_primary_rna_ngs_library()
+
+    @property
+    def rna_test_sample(self):
+        """The primary RNA test sample, if any, computed on first access
+
+        Consequently, ``MissingDataEntity`` for an RNA test sample without
+        enabled NGS library is only raised on first access.
+        """
+        try:
+            return self._rna_test_sample
+        except AttributeError:
+            self._rna_test_sample = self._get_primary_rna_test_sample()
+            return self._rna_test_sample
+
+    @property
+    def rna_ngs_library(self):
+        """The primary RNA NGS library for this sample, if any, computed on
+        first access
+        """
+        try:
+            return self._rna_ngs_library
+        except AttributeError:
+            self._rna_ngs_library = self._get_primary_rna_ngs_library()
+            return self._rna_ngs_library
 
     @property
     def is_tumor(self):
@@ -151,8 +183,7 @@ class CancerBioSample(GenericBioSample):
         """Spider through ``self.bio_sample`` and return primary DNA test
         sample
         """
-        sample = next(self._iter_all_test_samples(EXTRACTION_TYPE_DNA, True),
-                      None)
+        sample = self._primary_dna_test_sample
         if sample:
             return TestSampleShortcut(self, sample, 'ngs_library')
         else:
@@ -162,8 +193,7 @@ class CancerBioSample(GenericBioSample):
         """Spider through ``self.bio_sample`` and return primary RNA test
         sample, if any; ``None`` otherwise
         """
-        sample = next(self._iter_all_test_samples(EXTRACTION_TYPE_RNA, True),
-                      None)
+        sample = self._primary_rna_test_sample
         if sample:
             return TestSampleShortcut(self, sample, 'ngs_library')
         else:
@@ -189,32 +219,32 @@ class CancerBioSample(GenericBioSample):
         else:
             return None
 
-    def _iter_all_test_samples(self, ext_type, allow_none):
-        """Yield all test samples with the given extraction type
-
-        Require yielding of at least one unless ``allow_none``
+    def _classify_test_samples(self):
+        """Return first DNA and first RNA test sample of ``self.bio_sample``,
+        ``None`` for each extraction type without any test sample
         """
-        yielded_any = False
+        dna_test_sample = None
+        rna_test_sample = None
         for test_sample in self.bio_sample.test_samples.values():
-            if KEY_EXTRACTION_TYPE not in test_sample.extra_infos:
+            ext_type = test_sample.extra_infos.get(KEY_EXTRACTION_TYPE, _MISSING)
+            if ext_type is _MISSING:
                 raise MissingDataEntity(  # pragma: no cover
                     'Could not find "{}" flag in TestSample {}'.format(
                         KEY_EXTRACTION_TYPE, test_sample))
-            elif test_sample.extra_infos[KEY_EXTRACTION_TYPE] == ext_type:
-                yielded_any = True
-                yield test_sample
-        if not yielded_any and not allow_none:
-            raise MissingDataEntity(  # pragma: no cover
-                ('Could not find a TestSample with {} == {} for '
-                 'BioSample {}'.format(
-                     KEY_EXTRACTION_TYPE, ext_type, self.bio_sample)))
+            if ext_type == EXTRACTION_TYPE_DNA and dna_test_sample is None:
+                dna_test_sample = test_sample
+            elif ext_type == EXTRACTION_TYPE_RNA and rna_test_sample is None:
+                rna_test_sample = test_sample
+            if dna_test_sample and rna_test_sample:
+                break
+        return dna_test_sample, rna_test_sample
 
     def __repr__(self):
-        return 'CancerBioSample({})'.format(', '.join(
-            map(str, [self.bio_entity, self.bio_sample])))
+        return 'CancerBioSample({}, {})'.format(
+            self.bio_entity.name, self.bio_sample)
 
     def __str__(self):
-        return repr(self)
+        return 'CancerBioSample({})'.format(self.name)
 
 
 class CancerDonor(GenericBioEntity):
@@ -223,19 +253,19 @@ class CancerDonor(GenericBioEntity):
     # Override to use cancer-specific bio sample class
     bio_sample_class = CancerBioSample
 
+    __slots__ = ('_normal_bio_sample', '_tumor_bio_samples', 'primary_pair',
+                 'all_pairs')
+
     def __init__(self, shortcut_sheet, bio_entity):
         super().__init__(shortcut_sheet, bio_entity)
-        #: The primary ``CancerMatchedSamplePair``
-        self.primary_pair = self._get_primary_pair()
+        # Primary normal and all tumor ``BioSample`` objects, classified in
+        # one pass over ``self.bio_samples``
+        self._normal_bio_sample, self._tumor_bio_samples = (
+            self._classify_bio_samples())
         #: All tumor/normal pairs
         self.all_pairs = list(self._iter_all_pairs())
-
-    def _get_primary_pair(self):
-        """Return primary ``CancerMatchedSamplePair``"""
-        try:
-            return next(self._iter_all_pairs())
-        except StopIteration:
-            return None
+        #: The primary ``CancerMatchedSamplePair``
+        self.primary_pair = self.all_pairs[0] if self.all_pairs else None
 
     def _iter_all_pairs(self):
         """Iterate all tumor/normal pair"""
@@ -245,18 +275,37 @@ class CancerDonor(GenericBioEntity):
                 yield CancerMatchedSamplePair(
                     self, tumor_bio_sample, normal_bio_sample)
 
-    def _get_primary_normal_bio_sample(self):
-        """Return primary normal ``BioSample``
+    def _classify_bio_samples(self):
+        """Return primary normal ``BioSample`` (or ``None``) and list of all
+        tumor ``BioSample`` objects
+
+        The order depends on the order in ``self.bio_samples``.  If
+        the type of this attribute is an ordered dict, then the behaviour of
+        this function is reproducible, otherwise it is not.
 
         Raises ``MissingDataEntity`` in the case of problems
         """
+        normal_bio_sample = None
+        tumor_bio_samples = []
         for bio_sample in self.bio_samples.values():
-            if KEY_IS_TUMOR not in bio_sample.extra_infos:
+            is_tumor = bio_sample.extra_infos.get(KEY_IS_TUMOR, _MISSING)
+            if is_tumor is _MISSING:
                 raise MissingDataEntity(  # pragma: no cover
                     'Could not find "{}" flag in BioSample {}'.format(
                         KEY_IS_TUMOR, bio_sample))
-            elif not bio_sample.extra_infos[KEY_IS_TUMOR]:
-                return bio_sample
+            elif is_tumor:
+                tumor_bio_samples.append(bio_sample)
+            elif normal_bio_sample is None:
+                normal_bio_sample = bio_sample
+        return normal_bio_sample, tumor_bio_samples
+
+    def _get_primary_normal_bio_sample(self):
+        """Return primary normal ``BioSample``
+
+        Raises ``MissingDataEntity`` in the case of problems
+        """
+        if self._normal_bio_sample:
+            return self._normal_bio_sample
         # Having no normal sample is an error by default but this behaviour
         # can be switched off.
         tpl = 'Could not find primary normal sample for BioEntity {}'
@@ -269,22 +318,10 @@ class CancerDonor(GenericBioEntity):
     def _iter_tumor_bio_samples(self):
         """Return iterable over all cancer bio samples
 
-        The order depends on the order in ``self.bio_samples``.  If
-        the type of this attribute is an ordered dict, then the behaviour of
-        this function is reproducible, otherwise it is not.
-
         Raises ``MissingDataEntity`` in the case of problems
         """
-        yielded_any = False
-        for bio_sample in self.bio_samples.values():
-            if KEY_IS_TUMOR not in bio_sample.extra_infos:
-                raise MissingDataEntity(  # pragma: no cover
-                    'Could not find "{}" flag in BioSample {}'.format(
-                        KEY_IS_TUMOR, bio_sample))
-            elif bio_sample.extra_infos[KEY_IS_TUMOR]:
-                yielded_any = True
-                yield bio_sample
-        if not yielded_any:
+        yield from self._tumor_bio_samples
+        if not self._tumor_bio_samples:
             # Having no tumor sample is an error by default but this behaviour
             # can be switched off.
             tpl = 'Could not find a BioSample with {} = true for BioEntity {}'
@@ -295,8 +332,7 @@ class CancerDonor(GenericBioEntity):
                 warn(msg, MissingDataWarning)
 
     def __repr__(self):
-        return 'CancerDonor({})'.format(', '.join(map(
-            str, [self.sheet, self.bio_entity])))
+        return 'CancerDonor({}, {})'.format(self.sheet, self.bio_entity)
 
     def __str__(self):
-        return repr(self)
+        return 'CancerDonor({})'.format(self.name)
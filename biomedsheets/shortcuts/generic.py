@@ -2,8 +2,6 @@
 """Shortcuts for generic sample sheets
 """
 
-from collections import OrderedDict
-
 from .base import (ShortcutMixin)
 from .base import (ShortcutSampleSheet)
 
@@ -19,7 +17,7 @@ class GenericSampleSheet(ShortcutSampleSheet):
     def __init__(self, sheet):
         super().__init__(sheet)
         #: Generic wrapper BioEntity objects
-        self.bio_entities = OrderedDict(self._build_bio_entities())
+        self.bio_entities = self._build_bio_entities()
         #: List of all NGS libraries
         self.all_ngs_libraries = []
         #: List of the primary NGS libraries for each bio sample
@@ -29,8 +27,9 @@ class GenericSampleSheet(ShortcutSampleSheet):
 
     def _build_bio_entities(self):
         """Build GenericBioEntity objects for ``self.sheet``"""
-        for name, bio_entity in self.sheet.bio_entities.items():
-            yield name, GenericBioEntity(self, bio_entity)
+        return {
+            name: GenericBioEntity(self, bio_entity)
+            for name, bio_entity in self.sheet.bio_entities.items()}
 
     def _build_shortcuts(self):
         # Build self.{all,primary}_ngs_libraries
@@ -51,13 +50,14 @@ class GenericSampleSheet(ShortcutSampleSheet):
 class GenericNGSLibrary(ShortcutMixin):
     """Shortcut wrapper for NGS library in generic sample sheet"""
 
+    __slots__ = ('test_sample', 'parent', 'ngs_library')
+
     def __init__(self, shortcut_test_sample, ngs_library):
+        super().__init__(ngs_library)
         #: Parent GenericTestSample
         self.test_sample = shortcut_test_sample
         #: Parent object; for ShortcutMixin
         self.parent = shortcut_test_sample
-        #: Wrapped object
-        self.wrapped = ngs_library
         #: Wrapped NGSLibrary
         self.ngs_library = ngs_library
 
@@ -68,23 +68,26 @@ class GenericTestSample(ShortcutMixin):
     #: Type to use for creating bio samples
     ngs_library_class = GenericNGSLibrary
 
+    __slots__ = ('bio_sample', 'parent', 'test_sample', 'ngs_libraries')
+
     def __init__(self, shortcut_bio_sample, test_sample):
+        super().__init__(test_sample)
         #: Parent GenericBioSample
         self.bio_sample = shortcut_bio_sample
         #: Parent object; for ShortcutMixin
         self.parent = shortcut_bio_sample
-        #: Wrapped object
-        self.wrapped = test_sample
         #: Wrapped TestSample
         self.test_sample = test_sample
         #: Shortcut to NGSLibrary objects
-        self.ngs_libraries = OrderedDict(self._build_ngs_libraries())
+        self.ngs_libraries = self._build_ngs_libraries()
 
     def _build_ngs_libraries(self):
         """BuildGenericNGSLibrary objects from
         ``self.test_sample.ngs_libraries"""
-        for name, ngs_library in self.test_sample.ngs_libraries.items():
-            yield name, self.__class__.ngs_library_class(self, ngs_library)
+        ngs_library_class = self.__class__.ngs_library_class
+        return {
+            name: ngs_library_class(self, ngs_library)
+            for name, ngs_library in self.test_sample.ngs_libraries.items()}
 
 
 class GenericBioSample(ShortcutMixin):
@@ -93,23 +96,26 @@ class GenericBioSample(ShortcutMixin):
     #: Type to use for creating bio samples
     test_sample_class = GenericTestSample
 
+    __slots__ = ('bio_entity', 'parent', 'bio_sample', 'test_samples')
+
     def __init__(self, shortcut_bio_entity, bio_sample):
+        super().__init__(bio_sample)
         #: Parent GenericBioEntity
         self.bio_entity = shortcut_bio_entity
         #: Parent object; for ShortcutMixin
         self.parent = shortcut_bio_entity
-        #: Wrapped object
-        self.wrapped = bio_sample
         #: Wrapped BioSample
         self.bio_sample = bio_sample
         #: Shortcut BioSample objects
-        self.test_samples = OrderedDict(self._build_test_samples())
+        self.test_samples = self._build_test_samples()
 
     def _build_test_samples(self):
         """Build GenericTestSample objects for ``self.bio_sample.test_samples``
         """
-        for name, test_sample in self.bio_sample.test_samples.items():
-            yield name, self.__class__.test_sample_class(self, test_sample)
+        test_sample_class = self.__class__.test_sample_class
+        return {
+            name: test_sample_class(self, test_sample)
+            for name, test_sample in self.bio_sample.test_samples.items()}
 
 
 class GenericBioEntity(ShortcutMixin):
@@ -118,20 +124,23 @@ class GenericBioEntity(ShortcutMixin):
     #: Type to use for creating bio samples
     bio_sample_class = GenericBioSample
 
+    __slots__ = ('sheet', 'parent', 'bio_entity', 'bio_samples')
+
     def __init__(self, shortcut_sheet, bio_entity):
+        super().__init__(bio_entity)
         #: Parent GenericSampleSheet
         self.sheet = shortcut_sheet
         #: Parent object; for ShortcutMixin
         self.parent = None
-        #: Wrapped object; for ShortcutMixin
-        self.wrapped = bio_entity
         #: Wrapped BioEntity
         self.bio_entity = bio_entity
         #: Shortcut BioSample objects
-        self.bio_samples = OrderedDict(self._build_bio_samples())
+        self.bio_samples = self._build_bio_samples()
 
     def _build_bio_samples(self):
         """Build GenericBioSample objects for ``self.bio_entity.bio_samples``
         """
-        for name, bio_sample in self.bio_entity.bio_samples.items():
-            yield name, self.__class__.bio_sample_class(self, bio_sample)
+        bio_sample_class = self.__class__.bio_sample_class
+        return {
+            name: bio_sample_class(self, bio_sample)
+            for name, bio_sample in self.bio_entity.bio_samples.items()}
@@ -3,7 +3,9 @@
 """
 
 from collections import defaultdict, OrderedDict
-from copy import deepcopy
+from copy import copy
+from itertools import chain
+from operator import attrgetter
 from warnings import warn
 
 from .base import (
@@ -11,7 +13,6 @@ from .base import (
     MissingDataWarning, NGSLibraryShortcut, ShortcutSampleSheet, TestSampleShortcut
     )
 from .generic import GenericBioEntity
-from ..union_find import UnionFind
 
 __author__ = 'Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>'
 
@@ -20,6 +21,9 @@ __author__ = 'Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>'
 #: Key value for "extraction type" value
 KEY_EXTRACTION_TYPE = 'extractionType'
 
+# Sentinel for missing values in ``extra_infos`` lookups
+_MISSING = object()
+
 #: Key value for the "is affected" flag
 KEY_IS_AFFECTED = 'isAffected'
 
@@ -32,6 +36,9 @@ KEY_MOTHER_PK = 'motherPk'
 #: Key value for "sex".
 KEY_SEX = 'sex'
 
+#: Template for the ``UndefinedFieldException`` message
+_UNDEFINED_FIELD_TPL = "Field '{f}' is not defined for 'pk {pk}'. Available fields: {af}."
+
 
 def donor_has_dna_ngs_library(donor):
     """Predicate that returns whether the donor has a dna library."""
@@ -65,6 +72,9 @@ class Pedigree:
     be called.
     """
 
+    __slots__ = ('donors', 'index', 'affecteds', 'founders', 'name_to_donor',
+                 'pk_to_donor', 'secondary_id_to_donor')
+
     def __init__(self, donors=None, index=None):
         """Constructor.
 
@@ -86,7 +96,7 @@ class Pedigree:
         self.founders = []
         #: Mapping from individual name to donor individual
         self.name_to_donor = {}
-        #: Mapping from individual pk to donor individual
+        #: Mapping from individual pk (as ``str``) to donor individual
         self.pk_to_donor = {}
         #: Mapping from individual secondary_id to donor individual
         self.secondary_id_to_donor = {}
@@ -101,28 +111,24 @@ class Pedigree:
 
         :return: Returns Pedigree, removing donors not passing ``predicate``.
         """
-        if self.index and predicate(self.index):
-            index = self.index
-        else:
-            index = None
-
-        included = set()
-        for donor in filter(predicate, self.donors):
-            included.add(donor.name)
-
-        donors = []
-        for donor in self.donors:
-            if donor.name in included:
-                donor = deepcopy(donor)
-                if not donor._father or donor._father.name not in included:
-                    donor._father = None
-                    donor.extra_infos.pop(KEY_FATHER_PK, None)
-                if not donor._mother or donor._mother.name not in included:
-                    donor._mother = None
-                    donor.extra_infos.pop(KEY_MOTHER_PK, None)
-                donors.append(donor)
-
-        return Pedigree(donors, index)
+        # Clone the kept donors, keyed by name
+        kept = {
+            donor.name: donor._clone_for_filter()
+            for donor in self.donors if predicate(donor)}
+        # Link the clones to the cloned parents, drop removed parents
+        for donor in kept.values():
+            if donor._father:
+                donor._father = kept.get(donor._father.name)
+            if not donor._father:
+                donor._father = donor._father_pk = None
+                donor.extra_infos.pop(KEY_FATHER_PK, None)
+            if donor._mother:
+                donor._mother = kept.get(donor._mother.name)
+            if not donor._mother:
+                donor._mother = donor._mother_pk = None
+                donor.extra_infos.pop(KEY_MOTHER_PK, None)
+        index = kept.get(self.index.name) if self.index else None
+        return Pedigree(list(kept.values()), index)
 
     @property
     def member_count(self):
@@ -131,6 +137,27 @@ class Pedigree:
 
     def update_shortcuts(self):
         """Update the shortcut members"""
+        # Classify the donors and build the mappings in one pass
+        affecteds = []
+        founders = []
+        donors_with_libs = []
+        affecteds_with_libs = []
+        name_to_donor = {}
+        pk_to_donor = {}
+        secondary_id_to_donor = {}
+        for donor in self.donors:
+            has_libs = donor.dna_ngs_library or donor.rna_ngs_library
+            if has_libs:
+                donors_with_libs.append(donor)
+            if donor.is_affected:
+                affecteds.append(donor)
+                if has_libs:
+                    affecteds_with_libs.append(donor)
+            if donor.is_founder:
+                founders.append(donor)
+            name_to_donor[donor.name] = donor
+            pk_to_donor[str(donor.pk)] = donor
+            secondary_id_to_donor[donor.secondary_id] = donor
         if len(self.donors) == 1:
             # For singletons, use the single individual as index regardless
             # of affection state.  This allows the usage of cancer sample
@@ -138,82 +165,74 @@ class Pedigree:
             self.affecteds = []
             self.index = self.donors[0]
         else:
-            donors_with_libs = [
-                d for d in self.donors
-                if d.dna_ngs_library or d.rna_ngs_library]
-            affecteds_with_libs = [
-                d for d in donors_with_libs if d.is_affected]
-            self.affecteds = [d for d in self.donors if d.is_affected]
-            self.affecteds = list(sorted(self.affecteds, key=lambda d: d.name))
-            affecteds_with_libs = list(sorted(affecteds_with_libs, key=lambda d: d.name))
-            donors_with_libs = list(sorted(donors_with_libs, key=lambda d: d.name))
+            self.affecteds = sorted(affecteds, key=attrgetter('name'))
             if self.index is None:
+                # Pick first by name, preferring affected donors with libraries
                 if affecteds_with_libs:
-                    self.index = affecteds_with_libs[0]
+                    self.index = min(affecteds_with_libs, key=attrgetter('name'))
                 elif donors_with_libs:
-                    self.index = donors_with_libs[0]
+                    self.index = min(donors_with_libs, key=attrgetter('name'))
                 elif self.affecteds:
                     self.index = self.affecteds[0]
                 else:
                     self.index = self.donors[0]
-        self.founders = [d for d in self.donors if d.is_founder]
-        self.name_to_donor = OrderedDict([(d.name, d) for d in self.donors])
-        self.pk_to_donor = OrderedDict([(str(d.pk), d) for d in self.donors])
-        self.secondary_id_to_donor = OrderedDict([
-            (d.secondary_id, d) for d in self.donors])
+        self.founders = founders
+        self.name_to_donor = name_to_donor
+        self.pk_to_donor = pk_to_donor
+        self.secondary_id_to_donor = secondary_id_to_donor
 
     def __repr__(self):
-        return 'Pedigree({})'.format(', '.join(map(str, [
-            self.donors, self.index])))
+        return 'Pedigree({}, {})'.format(
+            [d.name for d in self.donors],
+            self.index.name if self.index else None)
 
     def __str__(self):
         return repr(self)
 
 
-def _append_pedigree_to_ped(pedigree, f):
+#: Mapping from affection state to PED file value
+_AFFECTED_MAP = {'affected': '2', 'unaffected': '1', 'unknown': '0'}
+
+#: Mapping from sex to PED file value
+_SEX_MAP = {'male': '1', 'female': '2', 'unknown': '0'}
+
+
+def _ped_name(donor):
+    """Return name of ``donor`` for PED file, prefer DNA library name"""
+    if donor.dna_ngs_library is None:
+        return donor.name
+    else:
+        return donor.dna_ngs_library.name
+
+
+def _append_pedigree_to_ped(pedigree, rows):
+    """Append PED file lines for ``pedigree`` to the list ``rows``"""
     family = 'FAM_' + pedigree.index.name
+    pk_to_donor = pedigree.pk_to_donor
     for donor in pedigree.donors:
-        affected = {
-            'affected': '2', 'unaffected': '1', 'unknown': '0'
-        }[donor.extra_infos.get(KEY_IS_AFFECTED, 'unknown')]
-        sex = {'male': '1', 'female': '2', 'unknown': '0'}[
-            donor.extra_infos.get(KEY_SEX, 'unknown')]
-        father = '0'
-        if donor.father_pk:
-            if hasattr(pedigree.pk_to_donor[donor.father_pk],
-                       'dna_ngs_library'):
-                donor_father = pedigree.pk_to_donor[donor.father_pk]
-                if donor_father.dna_ngs_library is None:
-                    father = donor_father.name
-                else:
-                    father = donor_father.dna_ngs_library.name
-        mother = '0'
-        if donor.mother_pk:
-            if hasattr(pedigree.pk_to_donor[donor.mother_pk],
-                       'dna_ngs_library'):
-                donor_mother = pedigree.pk_to_donor[donor.mother_pk]
-                if donor_mother.dna_ngs_library is None:
-                    mother = donor_mother.name
-                else:
-                    mother = donor_mother.dna_ngs_library.name
-        if hasattr(donor, 'dna_ngs_library'):
-            if donor.dna_ngs_library is None:
-                name = donor.name
-            else:
-                name = donor.dna_ngs_library.name
-            print('\t'.join(
-                (family, name, father, mother, sex, affected)), file=f)
+        extra_infos = donor.extra_infos
+        affected = _AFFECTED_MAP[extra_infos.get(KEY_IS_AFFECTED, 'unknown')]
+        sex = _SEX_MAP[extra_infos.get(KEY_SEX, 'unknown')]
+        father_pk = donor.father_pk
+        father = _ped_name(pk_to_donor[father_pk]) if father_pk else '0'
+        mother_pk = donor.mother_pk
+        mother = _ped_name(pk_to_donor[mother_pk]) if mother_pk else '0'
+        rows.append('\t'.join(
+            (family, _ped_name(donor), father, mother, sex, affected)) + '\n')
+    return rows
 
 
 def write_pedigree_to_ped(pedigree, path):
-    with open(path, 'wt') as f:
-        _append_pedigree_to_ped(pedigree, f)
+    write_pedigrees_to_ped((pedigree,), path)
 
 
 def write_pedigrees_to_ped(pedigrees, path):
+    # Collect all lines first and write them at once
+    rows = []
+    for pedigree in pedigrees:
+        _append_pedigree_to_ped(pedigree, rows)
     with open(path, 'wt') as f:
-        for pedigree in pedigrees:
-            _append_pedigree_to_ped(pedigree, f)
+        f.writelines(rows)
 
 
 class Cohort:
@@ -227,6 +246,11 @@ class Cohort:
     be called.
     """
 
+    __slots__ = ('pedigrees', 'indices', 'affecteds', 'name_to_pedigree',
+                 'name_to_donor', '_donor_pedigree_pairs', '_pk_to_pedigree',
+                 '_secondary_id_to_pedigree', '_pk_to_donor',
+                 '_secondary_id_to_donor')
+
     def __init__(self, pedigrees=None):
         #: The pedigrees in the cohort
         self.pedigrees = list(pedigrees or [])
@@ -236,16 +260,15 @@ class Cohort:
         self.affecteds = []
         #: Mapping from individual name to pedigree
         self.name_to_pedigree = {}
-        #: Mapping from individual pk to pedigree
-        self.pk_to_pedigree = {}
-        #: Mapping from individual secondary_id to pedigree
-        self.secondary_id_to_pedigree = {}
         #: Mapping from individual name to donor individual
         self.name_to_donor = {}
-        #: Mapping from individual pk to donor individual
-        self.pk_to_donor = {}
-        #: Mapping from individual secondary_id to donor individual
-        self.secondary_id_to_donor = {}
+        # All (donor, pedigree) pairs of the cohort
+        self._donor_pedigree_pairs = []
+        # The remaining mappings are built on first access, see properties
+        self._pk_to_pedigree = None
+        self._secondary_id_to_pedigree = None
+        self._pk_to_donor = None
+        self._secondary_id_to_donor = None
         # Initialize the shortcuts
         self.update_shortcuts()
 
@@ -259,55 +282,109 @@ class Cohort:
         """Return number of pedigrees in the cohort"""
         return len(self.pedigrees)
 
+    @property
+    def pk_to_pedigree(self):
+        """Mapping from individual pk to pedigree
+
+        Keyed by the ``pk`` as given in the sheet for compatibility, unlike
+        ``pk_to_donor`` which uses ``str`` keys matching ``father_pk`` and
+        ``mother_pk``.
+        """
+        if self._pk_to_pedigree is None:
+            self._pk_to_pedigree = self._build_mapping(
+                attrgetter('pk'), True, 'pk')
+        return self._pk_to_pedigree
+
+    @property
+    def secondary_id_to_pedigree(self):
+        """Mapping from individual secondary_id to pedigree"""
+        if self._secondary_id_to_pedigree is None:
+            self._secondary_id_to_pedigree = self._build_mapping(
+                attrgetter('secondary_id'), True, 'secondary id')
+        return self._secondary_id_to_pedigree
+
+    @property
+    def pk_to_donor(self):
+        """Mapping from individual pk (as ``str``) to donor individual
+
+        The ``str`` keys match ``father_pk`` and ``mother_pk`` and the keys of
+        ``Pedigree.pk_to_donor``.
+        """
+        if self._pk_to_donor is None:
+            self._pk_to_donor = self._build_mapping(
+                lambda donor: str(donor.pk), False, 'pk')
+        return self._pk_to_donor
+
+    @property
+    def secondary_id_to_donor(self):
+        """Mapping from individual secondary_id to donor individual"""
+        if self._secondary_id_to_donor is None:
+            self._secondary_id_to_donor = self._build_mapping(
+                attrgetter('secondary_id'), False, 'secondary id')
+        return self._secondary_id_to_donor
+
     def update_shortcuts(self):
-        """Update the shortcut members"""
+        """Update the shortcut members
+
+        The name mappings are re-built directly, the remaining mappings on
+        their next access.
+        """
         # Re-build lists of index and affected individuals
         self.indices = [p.index for p in self.pedigrees]
-        self.affecteds = sum((p.affecteds for p in self.pedigrees), [])
-        # Re-build mappings
+        self.affecteds = list(chain.from_iterable(
+            p.affecteds for p in self.pedigrees))
+        # Re-build flat list of (donor, pedigree) pairs and name mappings
+        self._donor_pedigree_pairs = []
         self.name_to_pedigree = {}
-        self.pk_to_pedigree = {}
-        self.secondary_id_to_pedigree = {}
         self.name_to_donor = {}
-        self.pk_to_donor = {}
-        self.secondary_id_to_donor = {}
+        duplicates = []
         for pedigree in self.pedigrees:
-            # Update {name,pk,secondary_id} to pedigree mapping
-            self._checked_update(
-                self.name_to_pedigree,
-                {d.name: pedigree for d in pedigree.donors}, 'name')
-            self._checked_update(
-                self.pk_to_pedigree,
-                {d.pk: pedigree for d in pedigree.donors}, 'pk')
-            self._checked_update(
-                self.secondary_id_to_pedigree,
-                {d.secondary_id: pedigree for d in pedigree.donors},
-                'secondary id')
-            # Update {name,pk,secondary_id} to donor mapping
-            self._checked_update(
-                self.name_to_donor,
-                {d.name: d for d in pedigree.donors}, 'name')
-            self._checked_update(
-                self.pk_to_donor, {d.pk: d for d in pedigree.donors}, 'pk')
-            self._checked_update(
-                self.secondary_id_to_donor, {
-                    d.secondary_id: d for d in pedigree.donors},
-                'secondary id')
-
-    def _checked_update(self, dest, other, msg_token):
-        """Check overlap of keys between ``dest`` and ``other``, update and
-        return dest
-
-        In case of error, use ``msg_token`` for exception message.
+            for donor in pedigree.donors:
+                self._donor_pedigree_pairs.append((donor, pedigree))
+                _checked_insert(
+                    self.name_to_pedigree, donor.name, pedigree, duplicates)
+                self.name_to_donor.setdefault(donor.name, donor)
+        _check_duplicates(duplicates, 'name')
+        # Reset the lazily built mappings
+        self._pk_to_pedigree = None
+        self._secondary_id_to_pedigree = None
+        self._pk_to_donor = None
+        self._secondary_id_to_donor = None
+
+    def _build_mapping(self, get_key, to_pedigree, msg_token):
+        """Return mapping from ``get_key(donor)`` to the pedigree if
+        ``to_pedigree`` and to the donor otherwise
+
+        In case of duplicate keys, use ``msg_token`` for exception message.
         """
-        overlap = set(dest.keys()) & set(other.keys())
-        if overlap:
-            tpl = ('Duplicate {}s when building '
-                   'cohort shortcuts: {}')  # pramga: no cover
-            raise ValueError(  # pramga: no cover
-                tpl.format(msg_token, list(sorted(overlap))))
-        dest.update(other)
-        return dest
+        result = {}
+        duplicates = []
+        for donor, pedigree in self._donor_pedigree_pairs:
+            _checked_insert(
+                result, get_key(donor), pedigree if to_pedigree else donor,
+                duplicates)
+        _check_duplicates(duplicates, msg_token)
+        return result
+
+
+def _checked_insert(dest, key, value, duplicates):
+    """Set ``dest[key] = value`` unless ``key`` is already present, in
+    which case ``key`` is appended to ``duplicates``
+    """
+    if key in dest:
+        duplicates.append(key)
+    else:
+        dest[key] = value
+
+
+def _check_duplicates(duplicates, msg_token):
+    """Raise ``ValueError`` listing all ``duplicates`` sorted, if any
+
+    Use ``msg_token`` for exception message.
+    """
+    if duplicates:
+        tpl = 'Duplicate {}s when building cohort shortcuts: {}'
+        raise ValueError(tpl.format(msg_token, sorted(set(duplicates))))
 
 
 class CohortBuilder:
@@ -342,22 +419,26 @@ class CohortBuilder:
             "row is not the same as the one found using custom join field '{join_by_field}'."
         )
         cohort = Cohort(self._yield_pedigrees())
-        for pedigree in cohort.pedigrees:
-            for donor in pedigree.donors:
-                if donor.father_pk:
-                    donor._father = cohort.pk_to_donor[int(donor.father_pk)]
-                    # Consistent check - it shouldn't be 'None' if pedigree correctly joint.
-                    if not pedigree.pk_to_donor.get(donor.father_pk, None):
-                        raise InconsistentPedigreeException(error_msg.format(
-                            id_=donor.bio_entity.secondary_id, join_by_field=self.join_by_field)
-                        )
-                if donor.mother_pk:
-                    donor._mother = cohort.pk_to_donor[int(donor.mother_pk)]
-                    # Consistent check - it shouldn't be 'None' if pedigree correctly joint
-                    if not pedigree.pk_to_donor.get(donor.mother_pk, None):
-                        raise InconsistentPedigreeException(error_msg.format(
-                            id_=donor.bio_entity.secondary_id, join_by_field=self.join_by_field)
-                        )
+        pk_to_donor = cohort.pk_to_donor
+        for donor, pedigree in cohort._donor_pedigree_pairs:
+            # Consistency check - the parents must be in the same pedigree if
+            # it was joined correctly
+            father_pk = donor._father_pk
+            if father_pk:
+                father = pk_to_donor.get(father_pk)
+                if father is None or father_pk not in pedigree.pk_to_donor:
+                    raise InconsistentPedigreeException(error_msg.format(
+                        id_=donor.bio_entity.secondary_id, join_by_field=self.join_by_field)
+                    )
+                donor._father = father
+            mother_pk = donor._mother_pk
+            if mother_pk:
+                mother = pk_to_donor.get(mother_pk)
+                if mother is None or mother_pk not in pedigree.pk_to_donor:
+                    raise InconsistentPedigreeException(error_msg.format(
+                        id_=donor.bio_entity.secondary_id, join_by_field=self.join_by_field)
+                    )
+                donor._mother = mother
         return cohort
 
     def _yield_pedigrees(self):
@@ -382,18 +463,15 @@ class CohortBuilder:
         # Initialise variables
         custom_field = self.join_by_field
         partition = defaultdict(list)
-        err_msg = "Field '{f}' is not defined for 'pk {pk}'. Available fields: {af}."
 
         # Partition the donors: iterate over GermlineDonor objects
         for donor in self.donors:
+            extra_infos = donor.extra_infos
             # Check if field is defined
-            if custom_field not in donor.extra_infos:
-                fields_str = ', '.join(donor.extra_infos.keys())
-                err_msg = err_msg.format(f=custom_field, pk=str(donor.pk), af=fields_str)
-                raise UndefinedFieldException(err_msg)
-            # Extra info
-            _id = donor.extra_infos.get(custom_field)
-            partition[_id].append(donor)
+            if custom_field not in extra_infos:
+                raise UndefinedFieldException(_UNDEFINED_FIELD_TPL.format(
+                    f=custom_field, pk=donor.pk, af=', '.join(extra_infos)))
+            partition[extra_infos[custom_field]].append(donor)
 
         # Return
         return partition
@@ -405,23 +483,46 @@ class CohortBuilder:
         """
         # Initialise variable
         partition = OrderedDict()
-        # Use Union-Find data structure for gathering pedigree donors
-        union_find = UnionFind()
-        for donor in self.donors:
-            for parent_pk in (pk for pk in (donor.father_pk, donor.mother_pk) if pk):
-                # String conversion is necessary because "fatherPk" and
-                # "motherPk" are given with type "str" in std_fields.json
-                union_find.union(str(donor.pk), parent_pk)
+        # Link donors to their parents in a forest of PKs for gathering
+        # pedigree donors.  String conversion is necessary because "fatherPk"
+        # and "motherPk" are given with type "str" in std_fields.json
+        pks = [str(donor.pk) for donor in self.donors]
+        parents = {}
+        for donor, pk in zip(self.donors, pks):
+            for parent_pk in (donor._father_pk, donor._mother_pk):
+                if parent_pk:
+                    root = _find_root(parents, pk)
+                    parent_root = _find_root(parents, parent_pk)
+                    if root != parent_root:
+                        parents[parent_root] = root
         # Partition the donors
-        for donor in self.donors:
-            partition.setdefault(union_find[str(donor.pk)], []).append(donor)
+        for donor, pk in zip(self.donors, pks):
+            partition.setdefault(_find_root(parents, pk), []).append(donor)
         # Return
         return partition
 
 
+def _find_root(parents, key):
+    """Return root of ``key`` in the forest ``parents``, compressing the path
+
+    Keys not yet in ``parents`` become roots of their own.
+    """
+    root = parents.setdefault(key, key)
+    while parents[root] != root:
+        root = parents[root]
+    while key != root:
+        parents[key], key = root, parents[key]
+    return root
+
+
 class GermlineDonor(GenericBioEntity):
     """Represent a donor in a germline study"""
 
+    __slots__ = ('_father', '_mother', '_father_pk', '_mother_pk',
+                 '_is_affected', 'dna_bio_sample', 'rna_bio_sample',
+                 'dna_test_sample', 'rna_test_sample', 'dna_ngs_library',
+                 'rna_ngs_library')
+
     def __init__(self, shortcut_sheet, bio_entity):
         super().__init__(shortcut_sheet, bio_entity)
         # ``GermlineDonor`` object for father, access via property, set in
@@ -430,10 +531,19 @@ class GermlineDonor(GenericBioEntity):
         # ``GermlineDonor`` object for mother, access via property, set in
         # ``CohortBuilder``
         self._mother = None
+        # PK of father, cached from ``extra_infos``, access via property
+        self._father_pk = self.extra_infos.get(KEY_FATHER_PK, None)
+        # PK of mother, cached from ``extra_infos``, access via property
+        self._mother_pk = self.extra_infos.get(KEY_MOTHER_PK, None)
+        # Affection flag, cached from ``extra_infos``, access via property
+        self._is_affected = self.extra_infos.get(
+            KEY_IS_AFFECTED, 'unaffected') == 'affected'
+        # Primary bio samples with DNA and RNA, searched for in one pass
+        dna_bio_sample, rna_bio_sample = self._find_primary_bio_samples()
         #: The primary bio sample with DNA
-        self.dna_bio_sample = self._get_primary_dna_bio_sample()
+        self.dna_bio_sample = self._wrap_bio_sample(dna_bio_sample)
         #: The primary bio sample with RNA, if any
-        self.rna_bio_sample = self._get_primary_rna_bio_sample()
+        self.rna_bio_sample = self._wrap_bio_sample(rna_bio_sample)
         #: The primary DNA test sample
         self.dna_test_sample = self._get_primary_dna_test_sample()
         #: The primary RNA test sample, if any
@@ -446,23 +556,22 @@ class GermlineDonor(GenericBioEntity):
     @property
     def is_affected(self):
         """Return whether or not the donor is affected"""
-        return self.extra_infos.get(
-            KEY_IS_AFFECTED, 'unaffected') == 'affected'
+        return self._is_affected
 
     @property
     def father_pk(self):
         """Return PK of father or ``None``"""
-        return self.extra_infos.get(KEY_FATHER_PK, None)
+        return self._father_pk
 
     @property
     def mother_pk(self):
         """Return PK of mother or ``None``"""
-        return self.extra_infos.get(KEY_MOTHER_PK, None)
+        return self._mother_pk
 
     @property
     def father(self):
         """Return mother ``GermlineDonor`` object or ``None``"""
-        if not self._father and self.father_pk:
+        if not self._father and self._father_pk:
             raise AttributeError(
                 'Father object not yet set, although PK available.  '
                 'Not processed through CohortBuilder?')
@@ -471,7 +580,7 @@ class GermlineDonor(GenericBioEntity):
     @property
     def mother(self):
         """Return mother ``GermlineDonor`` object or ``None``"""
-        if not self._mother and self.mother_pk:
+        if not self._mother and self._mother_pk:
             raise AttributeError(
                 'Mother object not yet set, although PK available.  '
                 'Not processed through CohortBuilder?')
@@ -480,24 +589,27 @@ class GermlineDonor(GenericBioEntity):
     @property
     def is_founder(self):
         """Return whether is founder, i.e., has neither mother nor father"""
-        return (not self.father_pk) and (not self.mother_pk)
+        return not (self._father_pk or self._mother_pk)
 
-    def _get_primary_dna_bio_sample(self):
-        """Spider through ``self.bio_entity`` and return primary bio sample
+    def _clone_for_filter(self):
+        """Return copy of the donor for ``Pedigree.with_filtered_donors()``
+
+        Only the wrapped ``BioEntity`` and its ``extra_infos`` are copied as
+        the parent information is removed from there, the remaining shortcut
+        structure is shared with ``self``.
         """
-        for sample in self._iter_all_bio_samples(EXTRACTION_TYPE_DNA, True):
-            if not sample.extra_infos.get('isTumor', False):
-                return BioSampleShortcut(self, sample, 'ngs_library')
-        return None
-
-    def _get_primary_rna_bio_sample(self):
-        """Spider through ``self.bio_entity`` and return primary bio sample
-        with RNA data, if any; ``None`` otherwise
+        clone = copy(self)
+        clone.wrapped = clone.bio_entity = copy(self.bio_entity)
+        clone.bio_entity.extra_infos = self.bio_entity.extra_infos.copy()
+        return clone
+
+    def _wrap_bio_sample(self, bio_sample):
+        """Return ``BioSampleShortcut`` for ``bio_sample``, if any; ``None``
+        otherwise
         """
-        for sample in self._iter_all_bio_samples(EXTRACTION_TYPE_RNA, True):
-            if not sample.extra_infos.get('isTumor', False):
-                return BioSampleShortcut(self, sample, 'ngs_library')
-        return None
+        if bio_sample is None:
+            return None
+        return BioSampleShortcut(self, bio_sample, 'ngs_library')
 
     def _get_primary_dna_test_sample(self):
         """Spider through ``self.bio_entity`` and return primary DNA test sample
@@ -542,34 +654,46 @@ class GermlineDonor(GenericBioEntity):
         else:
             return None
 
-    def _iter_all_bio_samples(self, ext_type, allow_none):
-        """Yield all bio samples with a test sample of the given extraction
-        type
+    def _find_primary_bio_samples(self):
+        """Spider through ``self.bio_entity`` and return the primary (i.e.,
+        first non-tumor) bio samples with DNA and with RNA, ``None`` if there
+        is none
 
-        Require yielding of at least one unless ``allow_none``
+        The search stops as soon as both are found; only the test samples
+        visited until then are required to have an extraction type.
         """
-        yielded_any = False
+        dna_bio_sample = rna_bio_sample = None
         for bio_sample in self.bio_entity.bio_samples.values():
+            need_dna = dna_bio_sample is None
+            need_rna = rna_bio_sample is None
+            if not (need_dna or need_rna):
+                break  # found both
+            has_dna = has_rna = False
             for test_sample in bio_sample.test_samples.values():
-                if KEY_EXTRACTION_TYPE not in test_sample.extra_infos:
+                if not (need_dna or need_rna):
+                    break  # each bio_sample only once per type
+                ext_type = test_sample.extra_infos.get(
+                    KEY_EXTRACTION_TYPE, _MISSING)
+                if ext_type is _MISSING:
                     raise MissingDataEntity(
                         'Could not find "{}" flag in TestSample {}'.format(
                             KEY_EXTRACTION_TYPE, test_sample))
-                elif test_sample.extra_infos[KEY_EXTRACTION_TYPE] == ext_type:
-                    yielded_any = True
-                    yield bio_sample
-                    break  # each bio_sample only once
-        if not yielded_any and not allow_none:
-            msg = 'Could not find a TestSample with {} == {} for BioEntity {}'
-            raise MissingDataEntity(msg.format(
-                KEY_EXTRACTION_TYPE, ext_type, self.bio_entity))
+                elif ext_type == EXTRACTION_TYPE_DNA and need_dna:
+                    has_dna, need_dna = True, False
+                elif ext_type == EXTRACTION_TYPE_RNA and need_rna:
+                    has_rna, need_rna = True, False
+            if not bio_sample.extra_infos.get('isTumor', False):
+                if has_dna:
+                    dna_bio_sample = bio_sample
+                if has_rna:
+                    rna_bio_sample = bio_sample
+        return dna_bio_sample, rna_bio_sample
 
     def __repr__(self):
-        return 'GermlineDonor({})'.format(', '.join(map(
-            str, [self.sheet, self.bio_entity])))
+        return 'GermlineDonor({}, {})'.format(self.sheet, self.bio_entity)
 
     def __str__(self):
-        return repr(self)
+        return 'GermlineDonor({})'.format(self.name)
 
 
 class GermlineCaseSheet(ShortcutSampleSheet):
@@ -598,44 +722,52 @@ class GermlineCaseSheet(ShortcutSampleSheet):
         #: the sample sheet
         self.cohort = CohortBuilder(self.donors, join_by_field).run()
         #: Mapping from index DNA NGS library name to pedigree
-        self.index_ngs_library_to_pedigree = OrderedDict(
-            self._index_ngs_library_to_pedigree())
+        self.index_ngs_library_to_pedigree = {}
         #: Mapping from any DNA NGS library name in pedigree to pedigree
-        self.donor_ngs_library_to_pedigree = OrderedDict([
-            (donor.dna_ngs_library.name, pedigree)
-            for pedigree in self.cohort.pedigrees
-            for donor in pedigree.donors if donor.dna_ngs_library])
+        self.donor_ngs_library_to_pedigree = {}
         #: Mapping from DNA NGS library name to donor
-        self.index_ngs_library_to_donor = OrderedDict([
-            (donor.dna_ngs_library.name, donor)
-            for donor in self.donors if donor.dna_ngs_library])
+        self.index_ngs_library_to_donor = {}
         #: Mapping from library name to object
-        self.library_name_to_library = OrderedDict(
-            self._library_name_to_library())
+        self.library_name_to_library = {}
+        # Build the library mappings
+        self._build_library_mappings()
 
     def _iter_donors(self):
         """Return iterator over the donors in the study"""
         for bio_entity in self.sheet.bio_entities.values():
             yield GermlineDonor(self, bio_entity)
 
-    def _index_ngs_library_to_pedigree(self):
-        """Build mapping from NGS library name to pedigree"""
+    def _build_library_mappings(self):
+        """Build the mappings from NGS library names
+
+        The pedigree mappings are built in one pass over the pedigrees, the
+        donor and library mappings in one pass over the donors so both keep
+        their order.
+        """
+        index_to_pedigree = self.index_ngs_library_to_pedigree
+        donor_to_pedigree = self.donor_ngs_library_to_pedigree
         for pedigree in self.cohort.pedigrees:
-            if not pedigree.index:
+            index = pedigree.index
+            if not index:
                 raise ValueError(  # pragma: no cover
                     'Found pedigree without index! {}'.format(pedigree))
-            if not pedigree.index.dna_ngs_library:
+            if not index.dna_ngs_library:
                 # Warn if pedigree does not have a NGS library
                 tpl = 'Pedigree index has no DNA library! {}/{}'
-                msg = tpl.format(pedigree.index, pedigree)
+                msg = tpl.format(index, pedigree)
                 warn(msg, MissingDataWarning)
-                continue
-            yield pedigree.index.dna_ngs_library.name, pedigree
-
-    def _library_name_to_library(self):
-        """Yield mapping from library name to library"""
+            for donor in pedigree.donors:
+                ngs_library = donor.dna_ngs_library
+                if ngs_library:
+                    donor_to_pedigree[ngs_library.name] = pedigree
+                    if donor is index:
+                        index_to_pedigree[ngs_library.name] = pedigree
+        index_to_donor = self.index_ngs_library_to_donor
+        name_to_library = self.library_name_to_library
         for donor in self.donors:
+            if donor.dna_ngs_library:
+                index_to_donor[donor.dna_ngs_library.name] = donor
             for bio_sample in donor.bio_samples.values():
                 for test_sample in bio_sample.test_samples.values():
                     for ngs_library in test_sample.ngs_libraries.values():
-                        yield ngs_library.name, ngs_library
+                        name_to_library[ngs_library.name] = ngs_library
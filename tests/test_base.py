@@ -4,6 +4,8 @@
 
 import pytest
 
+from biomedsheets import models
+from biomedsheets.shortcuts import base
 from biomedsheets.shortcuts.base import (
     InvalidSelector,
     MissingDataEntity
@@ -24,3 +26,10 @@ def test_missing_data_entity_exception():
     with pytest.raises(Exception) as exec_info:
         raise MissingDataEntity(error_msg)
     assert exec_info.value.args[0] == error_msg
+
+
+def test_invalid_selector_raised():
+    """Tests InvalidSelector raised for unknown TestSample child types."""
+    with pytest.raises(InvalidSelector):
+        base.TestSampleShortcut(
+            None, models.TestSample(1, False, 'DNA1'), 'ms_protein_pool')
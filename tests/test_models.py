@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests for the models module"""
+
+import collections
+import os
+
+import pytest
+
+from biomedsheets import io, models, ref_resolver
+
+__author__ = 'Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>'
+
+
+@pytest.fixture
+def sheet_cancer():
+    """Return ``Sheet`` instance for the cancer example"""
+    path = os.path.join(os.path.abspath(
+        os.path.dirname(__file__)), 'data', 'example_cancer.json')
+    sheet_json = io.json_loads_ordered(open(path, 'rt').read())
+    resolver = ref_resolver.RefResolver(dict_class=collections.OrderedDict)
+    return io.SheetBuilder(
+        resolver.resolve('file://' + path, sheet_json)).run()
+
+
+def test_merge_sub_entries():
+    """Tests merging of sub entry dicts"""
+    mixin = models.CrawlMixin()
+    assert mixin._merge_sub_entries({'a': 1}, {'b': 2}, {'c': 3}) == {
+        'a': 1, 'b': 2, 'c': 3}
+
+
+def test_merge_sub_entries_duplicates():
+    """Tests AmbiguousSecondaryIdException raised on duplicate secondary IDs"""
+    mixin = models.CrawlMixin()
+    with pytest.raises(models.AmbiguousSecondaryIdException) as e_info:
+        mixin._merge_sub_entries({'a': 1, 'b': 2}, {'c': 3}, {'b': 4})
+    assert str(e_info.value) == "Ambiguous secondary IDs: {'b'}"
+
+
+def test_crawl_custom_separator():
+    """Tests crawling with a custom separator over multiple levels"""
+    test_sample = models.TestSample(3, False, 'DNA1')
+    bio_sample = models.BioSample(
+        2, False, 'N1', test_samples={'DNA1': test_sample})
+    bio_entity = models.BioEntity(
+        1, False, 'P001', bio_samples={'N1': bio_sample})
+    assert bio_entity.crawl('N1/DNA1', sep='/') is test_sample
+    with pytest.raises(models.SecondaryIDNotFoundException):
+        bio_entity.crawl('N1-DNA1', sep='/')
+
+
+def test_crawl_sheet(sheet_cancer):
+    """Tests crawling from the sheet down to each entry level"""
+    bio_entity = sheet_cancer.crawl('EX_001')
+    assert isinstance(bio_entity, models.BioEntity)
+    bio_sample = sheet_cancer.crawl('EX_001-N1')
+    assert bio_sample is bio_entity.bio_samples['N1']
+    test_sample = sheet_cancer.crawl('EX_001-N1-DNA1')
+    assert test_sample is bio_sample.test_samples['DNA1']
+    ngs_library = sheet_cancer.crawl('EX_001-N1-DNA1-WES1')
+    assert ngs_library is test_sample.ngs_libraries['WES1']
+    assert ngs_library.name == 'EX_001-N1-DNA1-WES1-000004'
+    assert bio_entity.crawl('N1-DNA1-WES1') is ngs_library
+
+
+def test_crawl_sheet_not_found(sheet_cancer):
+    """Tests SecondaryIDNotFoundException raised on invalid paths"""
+    with pytest.raises(models.SecondaryIDNotFoundException):
+        sheet_cancer.crawl('EX_001-X1')
+    with pytest.raises(models.SecondaryIDNotFoundException):
+        sheet_cancer.crawl('EX_001-N1-DNA1-WES1-XXX')
+
+
+def test_entries_default_containers():
+    """Tests construction of entries with default ``None`` containers"""
+    entries = [
+        models.BioEntity(1, False, 'P001'),
+        models.BioSample(2, False, 'N1'),
+        models.TestSample(3, False, 'DNA1'),
+        models.NGSLibrary(4, False, 'WES1'),
+    ]
+    for entry in entries:
+        assert entry.extra_ids == []
+        assert entry.extra_infos == {}
+    assert entries[0].bio_samples == {}
+    assert entries[1].test_samples == {}
+    assert entries[2].ngs_libraries == {}
+    assert entries[2].sub_entries == {}
@@ -6,7 +6,7 @@ import os
 
 import pytest
 
-from biomedsheets import io, ref_resolver, shortcuts
+from biomedsheets import io, models, ref_resolver, shortcuts
 
 
 __author__ = 'Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>'
@@ -106,6 +106,7 @@ def test_cancer_donor(sheet_cancer):
     assert donor.primary_pair.tumor_sample.name == 'EX_001-T1-000005'
     assert donor.primary_pair.normal_sample.name == 'EX_001-N1-000002'
     assert len(donor.all_pairs) == 1
+    assert donor.primary_pair is donor.all_pairs[0]
 
 
 def test_cancer_bio_sample(sheet_cancer):
@@ -117,3 +118,27 @@ def test_cancer_bio_sample(sheet_cancer):
     normal_sample = cancer_cases.donors[0].primary_pair.normal_sample
     assert normal_sample.name == 'EX_001-N1-000002'
     assert not normal_sample.is_tumor
+
+
+def test_cancer_bio_sample_rna_disabled():
+    """Test ``CancerBioSample`` with all RNA NGS libraries disabled
+
+    The RNA shortcuts are computed lazily, so the error is only raised on
+    access.
+    """
+    test_samples = {
+        'DNA1': models.TestSample(
+            3, False, 'DNA1', extra_infos={'extractionType': 'DNA'},
+            ngs_libraries={'WES1': models.NGSLibrary(5, False, 'WES1')}),
+        'RNA1': models.TestSample(
+            4, False, 'RNA1', extra_infos={'extractionType': 'RNA'},
+            ngs_libraries={'mRNA_seq1': models.NGSLibrary(6, True, 'mRNA_seq1')}),
+    }
+    bio_sample = models.BioSample(
+        2, False, 'N1', extra_infos={'isTumor': False}, test_samples=test_samples)
+    normal_sample = shortcuts.CancerBioSample(None, bio_sample)
+    assert normal_sample.dna_ngs_library.secondary_id == 'WES1'
+    with pytest.raises(shortcuts.MissingDataEntity):
+        normal_sample.rna_test_sample
+    with pytest.raises(shortcuts.MissingDataEntity):
+        normal_sample.rna_ngs_library
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """Tests for the shortcuts module with germline sample sheet"""
 
+import copy
 import io
 import textwrap
 
 import pytest
 
-from biomedsheets import io_tsv, naming, shortcuts
+from biomedsheets import io_tsv, models, naming, shortcuts
 from biomedsheets.shortcuts.germline import InconsistentPedigreeException, UndefinedFieldException
 
 __author__ = 'Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>'
@@ -316,6 +317,15 @@ def test_undefined_field_exception():
     assert exec_info.value.args[0] == error_msg
 
 
+def test_undefined_join_by_field(sheet_germline):
+    """Tests UndefinedFieldException raised for undefined join field."""
+    builder = shortcuts.CohortBuilder(sheet_germline.donors, join_by_field='familyId')
+    with pytest.raises(UndefinedFieldException) as exec_info:
+        builder.run()
+    assert exec_info.value.args[0].startswith(
+        "Field 'familyId' is not defined for 'pk 1'. Available fields: ")
+
+
 def test_sheet_germline_trio_plus_exception(tsv_sheet_germline_trio_plus):
     """Tests UndefinedFieldException raise while creating GermlineCaseSheet"""
     with pytest.raises(UndefinedFieldException):
@@ -434,6 +444,66 @@ def test_pedigree(sheet_germline):
     assert list(pedigree.secondary_id_to_donor) == ['index1', 'father1', 'mother1']
 
 
+def test_pedigree_with_filtered_donors(sheet_germline):
+    """Tests for Pedigree.with_filtered_donors()"""
+    pedigree = sheet_germline.cohort.pedigrees[0]
+    filtered = pedigree.with_filtered_donors(lambda d: d.secondary_id != 'father1')
+    assert [d.name for d in filtered.donors] == ['index1-000001', 'mother1-000009']
+    assert filtered.index.name == 'index1-000001'
+    index1 = filtered.donors[0]
+    assert index1.father_pk is None
+    assert index1.father is None
+    assert index1.mother_pk == '9'
+    assert index1.mother is filtered.donors[1]
+    # The original pedigree is not modified
+    assert pedigree.donors[0].father_pk == '5'
+    assert pedigree.donors[0].father.name == 'father1-000005'
+
+
+def test_pedigree_deepcopy(sheet_germline):
+    """Tests deep copies of Pedigree, Cohort, and GermlineDonor objects"""
+    cohort = sheet_germline.cohort
+    cohort_copy = copy.deepcopy(cohort)
+    pedigree, pedigree_copy = cohort.pedigrees[0], cohort_copy.pedigrees[0]
+    assert [d.name for d in pedigree_copy.donors] == [d.name for d in pedigree.donors]
+    assert pedigree_copy.index is not pedigree.index
+    assert pedigree_copy.index.father is pedigree_copy.donors[1]
+    assert cohort_copy.name_to_donor['index1-000001'] is pedigree_copy.index
+    # Copy a donor on its own
+    index1 = pedigree.index
+    index1_copy = copy.deepcopy(index1)
+    assert index1_copy is not index1
+    assert index1_copy.father is not index1.father
+    assert index1_copy.father.name == index1.father.name
+    assert index1_copy.bio_samples is not index1.bio_samples
+    assert index1_copy.dna_ngs_library is not index1.dna_ngs_library
+
+
+def test_pedigree_deepcopy_shared(sheet_germline):
+    """Tests shared objects are copied once when deep-copying a container"""
+    cohort = sheet_germline.cohort
+    pedigree = cohort.pedigrees[0]
+    cohort_copy, pedigree_copy = copy.deepcopy([cohort, pedigree])
+    assert pedigree_copy is cohort_copy.pedigrees[0]
+    donor_copy, pedigree_copy = copy.deepcopy([pedigree.index, pedigree])
+    assert donor_copy is pedigree_copy.index
+
+
+def test_write_pedigrees_to_ped(sheet_germline, tmpdir):
+    """Tests writing pedigrees to PED file"""
+    path = str(tmpdir.join('out.ped'))
+    shortcuts.write_pedigrees_to_ped(sheet_germline.cohort.pedigrees, path)
+    with open(path, 'rt') as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 6
+    assert lines[:3] == [
+        'FAM_index1-000001\tindex1-N1-DNA1-WES1-000004\t'
+        'father1-N1-DNA1-WES1-000008\tmother1-N1-DNA1-WES1-000012\t1\t2',
+        'FAM_index1-000001\tfather1-N1-DNA1-WES1-000008\t0\t0\t1\t1',
+        'FAM_index1-000001\tmother1-N1-DNA1-WES1-000012\t0\t0\t1\t1',
+    ]
+
+
 def test_cohorts(sheet_germline):
     """Tests for Cohort object"""
     cohort = sheet_germline.cohort
@@ -448,6 +518,7 @@ def test_cohorts(sheet_germline):
         'mother1-000009',
         'mother2-000021'}
     assert set(cohort.pk_to_pedigree) == {1, 17, 5, 21, 9, 13}
+    assert set(cohort.pk_to_donor) == {'1', '17', '5', '21', '9', '13'}
     assert set(cohort.secondary_id_to_pedigree) == {'index1', 'father1', 'index2', 'mother1', 'father2', 'mother2'}
     assert set(cohort.name_to_donor) == {
         'father1-000005',
@@ -461,6 +532,41 @@ def test_cohorts(sheet_germline):
     assert cohort.pedigree_count == 2
 
 
+def test_cohort_duplicate_donors(sheet_germline):
+    """Tests ValueError raised on donors shared between pedigrees"""
+    pedigree = sheet_germline.cohort.pedigrees[0]
+    with pytest.raises(ValueError) as e_info:
+        shortcuts.Cohort([pedigree, pedigree])
+    assert str(e_info.value) == (
+        'Duplicate names when building cohort shortcuts: '
+        "['father1-000005', 'index1-000001', 'mother1-000009']")
+
+
+def test_cohort_duplicate_lazy_mappings():
+    """Tests ValueError raised on access of mappings with duplicate keys"""
+    donors = [
+        shortcuts.GermlineDonor(None, models.BioEntity(1, False, 'P001')),
+        shortcuts.GermlineDonor(None, models.BioEntity(1, False, 'P002')),
+        shortcuts.GermlineDonor(None, models.BioEntity(3, False, 'P001')),
+    ]
+    cohort = shortcuts.Cohort([shortcuts.Pedigree(donors[:2]), shortcuts.Pedigree(donors[2:])])
+    assert len(cohort.name_to_donor) == 3
+    with pytest.raises(ValueError) as e_info:
+        cohort.pk_to_pedigree
+    assert str(e_info.value) == 'Duplicate pks when building cohort shortcuts: [1]'
+    with pytest.raises(ValueError) as e_info:
+        cohort.secondary_id_to_donor
+    assert str(e_info.value) == (
+        "Duplicate secondary ids when building cohort shortcuts: ['P001']")
+
+
+def test_cohort_builder_missing_parent(sheet_germline):
+    """Tests InconsistentPedigreeException raised for parent missing from cohort"""
+    index1, _, mother1 = sheet_germline.cohort.pedigrees[0].donors
+    with pytest.raises(InconsistentPedigreeException):
+        shortcuts.CohortBuilder([index1, mother1]).run()
+
+
 def test_sheet_germline_inconsistent_pedigree(
     tsv_sheet_germline_inconsistent_pedigree,
     tsv_sheet_germline_trio_plus,
@@ -489,3 +595,46 @@ def test_sheet_germline_inconsistent_pedigree(
             sheet=io_tsv.read_germline_tsv_sheet(tsv_sheet_germline_inconsistent_pedigree),
             join_by_field='familyId'
         )
+
+
+def test_germline_donor_dna_and_rna():
+    """Tests GermlineDonor with DNA and RNA test samples in one bio sample"""
+    test_samples = {
+        'DNA1': models.TestSample(
+            3, False, 'DNA1', extra_infos={'extractionType': 'DNA'},
+            ngs_libraries={'WES1': models.NGSLibrary(5, False, 'WES1')}),
+        'RNA1': models.TestSample(
+            4, False, 'RNA1', extra_infos={'extractionType': 'RNA'},
+            ngs_libraries={'mRNA_seq1': models.NGSLibrary(6, False, 'mRNA_seq1')}),
+    }
+    bio_sample = models.BioSample(2, False, 'N1', test_samples=test_samples)
+    bio_entity = models.BioEntity(1, False, 'P001', bio_samples={'N1': bio_sample})
+    donor = shortcuts.GermlineDonor(None, bio_entity)
+    assert donor.dna_bio_sample.bio_sample is bio_sample
+    assert donor.rna_bio_sample.bio_sample is bio_sample
+    # Missing extraction type
+    del test_samples['RNA1'].extra_infos['extractionType']
+    with pytest.raises(shortcuts.MissingDataEntity):
+        shortcuts.GermlineDonor(None, bio_entity)
+
+
+def test_germline_donor_stops_after_primary_bio_samples():
+    """Tests GermlineDonor ignores bio samples after the primary DNA and RNA ones"""
+    test_samples = {
+        'DNA1': models.TestSample(
+            3, False, 'DNA1', extra_infos={'extractionType': 'DNA'},
+            ngs_libraries={'WES1': models.NGSLibrary(5, False, 'WES1')}),
+        'RNA1': models.TestSample(
+            4, False, 'RNA1', extra_infos={'extractionType': 'RNA'},
+            ngs_libraries={'mRNA_seq1': models.NGSLibrary(6, False, 'mRNA_seq1')}),
+    }
+    bio_samples = {
+        'N1': models.BioSample(2, False, 'N1', test_samples=test_samples),
+        'N2': models.BioSample(7, False, 'N2', test_samples={
+            'DNA2': models.TestSample(8, False, 'DNA2')}),
+    }
+    bio_entity = models.BioEntity(1, False, 'P001', bio_samples=bio_samples)
+    donor = shortcuts.GermlineDonor(None, bio_entity)
+    assert donor.dna_bio_sample.bio_sample is bio_samples['N1']
+    assert donor.rna_bio_sample.bio_sample is bio_samples['N1']
+    assert donor.dna_ngs_library.secondary_id == 'WES1'